@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
@@ -67,15 +68,17 @@ class ExtensionLoadReport:
         return [item for item in self.diagnostics if item.level == 'warning']
 
 
-def _is_extension_dir(candidate: Path) -> bool:
-    name = candidate.name
+def _is_extension_dir(entry: os.DirEntry[str]) -> bool:
+    name = entry.name
     if name.startswith('.') or name.startswith('__'):
         return False
-    return candidate.is_dir()
+    return entry.is_dir()
 
 
 def _iter_extension_dirs(extensions_dir: Path) -> list[Path]:
-    return sorted(candidate for candidate in extensions_dir.iterdir() if _is_extension_dir(candidate))
+    # scandir entries carry the dirent type, so is_dir() needs no extra stat.
+    with os.scandir(extensions_dir) as entries:
+        return sorted(Path(entry.path) for entry in entries if _is_extension_dir(entry))
 
 
 def discover_extension_manifests(extensions_dir: Path) -> list[Path]:
@@ -100,9 +103,9 @@ def _resolve_extensions_dir(repo_root: Path, extensions_dir: Path | None) -> Pat
     return (repo_root / extensions_dir).resolve()
 
 
-def _resolve_repo_file(repo_root: Path, rel_path: str, *, context: str) -> Path:
+def _resolve_repo_file(resolved_repo: Path, rel_path: str, *, context: str) -> Path:
+    # load_extensions resolves the repo root once; callers pass it through.
     safe_rel = ensure_safe_relative_path(rel_path)
-    resolved_repo = repo_root.resolve()
     target = (resolved_repo / safe_rel).resolve()
 
     try:
@@ -142,7 +145,7 @@ def _resolve_declared_file(
         )
         return None
 
-    if not resolved.exists() or not resolved.is_file():
+    if not resolved.is_file():
         report.diagnostics.append(
             ExtensionDiagnostic(
                 level='error',
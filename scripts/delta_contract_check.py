@@ -12,7 +12,6 @@ from typing import Any
 from delta_contracts import (
     inspect_extensions,
     validate_delta_contract_policy,
-    validate_extension_manifest,
     validate_migration_sync_policy,
     validate_state_migration_manifest,
 )
@@ -57,26 +56,14 @@ def _resolve(repo_root: Path, path: Path) -> Path:
 
 def _collect_extension_version_issues(
     *,
-    repo_root: Path,
-    extensions_dir: Path,
+    extension_manifests: dict[Path, dict[str, Any]],
     max_version: int,
 ) -> list[str]:
     issues: list[str] = []
 
-    if not extensions_dir.exists() or not extensions_dir.is_dir():
-        return issues
-
-    for extension_dir in sorted(path for path in extensions_dir.iterdir() if path.is_dir()):
-        manifest_path = extension_dir / 'manifest.json'
-        if not manifest_path.exists():
-            continue
-
-        try:
-            manifest = validate_extension_manifest(load_json(manifest_path), context=str(manifest_path))
-        except (FileNotFoundError, ValueError):
-            # Base extension validation is already handled via inspect_extensions.
-            continue
-
+    # Manifests were already loaded and validated by inspect_extensions; base
+    # validation failures are reported there and are absent from this mapping.
+    for manifest_path, manifest in extension_manifests.items():
         commands = manifest.get('commands')
         if not isinstance(commands, dict) or not commands:
             continue
@@ -107,7 +94,7 @@ def _validate_cross_contract_invariants(
     state_manifest_payload: dict[str, Any],
     contract_policy_path: Path,
     contract_policy_payload: dict[str, Any],
-    extensions_dir: Path,
+    extension_manifests: dict[Path, dict[str, Any]],
 ) -> list[str]:
     issues: list[str] = []
 
@@ -175,8 +162,7 @@ def _validate_cross_contract_invariants(
             if isinstance(version_value, int):
                 issues.extend(
                     _collect_extension_version_issues(
-                        repo_root=repo_root,
-                        extensions_dir=extensions_dir,
+                        extension_manifests=extension_manifests,
                         max_version=version_value,
                     ),
                 )
@@ -231,14 +217,14 @@ def main() -> int:
                 state_manifest_payload=manifest_payload,
                 contract_policy_path=contract_policy_path,
                 contract_policy_payload=contract_policy_payload,
-                extensions_dir=extensions_dir,
+                extension_manifests=extension_report.manifests,
             ),
         )
 
     if issues:
-        print('Delta contract check: issues found', file=sys.stderr)
-        for issue in issues:
-            print(f'- {issue}', file=sys.stderr)
+        sys.stderr.write(
+            'Delta contract check: issues found\n' + ''.join(f'- {issue}\n' for issue in issues),
+        )
         return 1 if args.strict else 0
 
     print(
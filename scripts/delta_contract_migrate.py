@@ -18,7 +18,7 @@ from delta_contracts import (
     validate_state_migration_manifest,
 )
 from delta_contracts_lib.common import normalize_slug
-from migration_sync_lib import load_json, resolve_repo_root, resolve_safe_child
+from migration_sync_lib import list_child_dirs, load_json, resolve_repo_root, resolve_safe_child
 
 
 @dataclass(frozen=True)
@@ -59,17 +59,25 @@ def _resolve(repo_root: Path, path: Path) -> Path:
     return path if path.is_absolute() else (repo_root / path).resolve()
 
 
-def _stable_command_key(namespace: str, raw_key: str, seen: set[str]) -> str:
+def _stable_command_key(
+    namespace: str,
+    raw_key: str,
+    seen: set[str],
+    next_counters: dict[str, int],
+) -> str:
     candidate_suffix = normalize_slug(raw_key)
     if not candidate_suffix:
         candidate_suffix = 'command'
 
-    counter = 1
+    # Resume numbering after the last key issued for this suffix; lower counters
+    # are already taken, so repeated slugs do not rescan them.
+    counter = next_counters.get(candidate_suffix, 1)
     while True:
         suffix = candidate_suffix if counter == 1 else f'{candidate_suffix}-{counter}'
         command_key = f'{namespace}/{suffix}'
         if command_key not in seen:
             seen.add(command_key)
+            next_counters[candidate_suffix] = counter + 1
             return command_key
         counter += 1
 
@@ -92,6 +100,7 @@ def _migrate_extension_manifest(manifest: dict[str, Any]) -> tuple[dict[str, Any
     )
 
     seen_keys: set[str] = set()
+    next_counters: dict[str, int] = {}
     migrated_commands: dict[str, str] = {}
     changed = False
 
@@ -101,11 +110,16 @@ def _migrate_extension_manifest(manifest: dict[str, Any]) -> tuple[dict[str, Any
 
         normalized_key = key.strip()
         if normalized_key.startswith(f'{namespace}/'):
-            command_key = _stable_command_key(namespace, normalized_key.split('/', 1)[1], seen_keys)
+            command_key = _stable_command_key(
+                namespace,
+                normalized_key.split('/', 1)[1],
+                seen_keys,
+                next_counters,
+            )
             if command_key != normalized_key:
                 changed = True
         else:
-            command_key = _stable_command_key(namespace, normalized_key, seen_keys)
+            command_key = _stable_command_key(namespace, normalized_key, seen_keys, next_counters)
             changed = True
 
         migrated_commands[command_key] = rel_path
@@ -189,14 +203,14 @@ def _migrate_target_extension_commands(
     changed_files: list[Path] = []
     inspected = 0
 
-    for extension_dir in sorted(path for path in extensions_dir.iterdir() if path.is_dir()):
+    for extension_dir in list_child_dirs(extensions_dir):
         manifest_path = extension_dir / 'manifest.json'
         if not manifest_path.exists():
             continue
 
         inspected += 1
         manifest_payload = load_json(manifest_path)
-        migrated_payload, changed = _migrate_extension_manifest(dict(manifest_payload))
+        migrated_payload, changed = _migrate_extension_manifest(manifest_payload)
         if not changed:
             continue
 
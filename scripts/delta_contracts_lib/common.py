@@ -5,6 +5,9 @@ from collections.abc import Iterable
 from typing import Any
 
 COMMAND_PART_RE = re.compile(r'^[a-z0-9][a-z0-9-]*$')
+SHA256_HEX_RE = re.compile(r'[0-9a-fA-F]{64}')
+PATH_TRAVERSAL_RE = re.compile(r'(?:^|/)\.\.(?:/|$)')
+SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
 
 
 def expect_dict(value: object, *, context: str) -> dict[str, Any]:
@@ -80,7 +83,7 @@ def validate_glob_patterns(patterns: Iterable[str], *, context: str) -> list[str
         stripped = expect_non_empty_str(pattern, context=f'{context}[{index}]')
         if stripped.startswith('/'):
             raise ValueError(f'{context}[{index}] must be relative (no absolute paths)')
-        if '..' in stripped.split('/'):
+        if PATH_TRAVERSAL_RE.search(stripped):
             raise ValueError(f'{context}[{index}] must not contain path traversal (`..`)')
         validated.append(stripped)
     return validated
@@ -96,7 +99,5 @@ def validate_command_part(value: object, *, context: str) -> str:
 
 
 def normalize_slug(value: str) -> str:
-    lowered = value.strip().lower()
-    slug = re.sub(r'[^a-z0-9]+', '-', lowered)
-    slug = re.sub(r'-+', '-', slug).strip('-')
-    return slug
+    # Hyphens are separators too, so one pass already collapses runs of them.
+    return SLUG_SEPARATOR_RE.sub('-', value.strip().lower()).strip('-')
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-from migration_sync_lib import load_json, resolve_safe_child
+from migration_sync_lib import list_child_dirs, load_json, resolve_safe_child
 
 from .extension import validate_extension_manifest
 
@@ -15,6 +16,24 @@ class ExtensionInspection:
     names: list[str]
     command_registry: dict[str, Path]
     issues: list[str]
+    manifests: dict[Path, dict[str, Any]] = field(default_factory=dict)
+
+
+def _resolve_declared_file(
+    repo_root: Path,
+    rel_path: str,
+    *,
+    context: str,
+    resolved_files: dict[str, tuple[Path, bool]],
+) -> tuple[Path, bool]:
+    """Resolve a declared path once per inspection run; errors are not cached."""
+
+    cached = resolved_files.get(rel_path)
+    if cached is None:
+        resolved = resolve_safe_child(repo_root, rel_path, context=context)
+        cached = (resolved, resolved.is_file())
+        resolved_files[rel_path] = cached
+    return cached
 
 
 def inspect_extensions(repo_root: Path, extensions_dir: Path) -> ExtensionInspection:
@@ -23,13 +42,20 @@ def inspect_extensions(repo_root: Path, extensions_dir: Path) -> ExtensionInspec
     issues: list[str] = []
     names: list[str] = []
     command_registry: dict[str, Path] = {}
+    manifests: dict[Path, dict[str, Any]] = {}
+    resolved_files: dict[str, tuple[Path, bool]] = {}
     seen_names: set[str] = set()
 
     if not extensions_dir.exists() or not extensions_dir.is_dir():
         issues.append(f'Extensions directory missing: {extensions_dir}')
-        return ExtensionInspection(names=names, command_registry=command_registry, issues=issues)
-
-    for extension_dir in sorted(path for path in extensions_dir.iterdir() if path.is_dir()):
+        return ExtensionInspection(
+            names=names,
+            command_registry=command_registry,
+            issues=issues,
+            manifests=manifests,
+        )
+
+    for extension_dir in list_child_dirs(extensions_dir):
         manifest_path = extension_dir / 'manifest.json'
         if not manifest_path.exists():
             issues.append(f'{extension_dir.name}: missing manifest.json')
@@ -41,6 +67,7 @@ def inspect_extensions(repo_root: Path, extensions_dir: Path) -> ExtensionInspec
             issues.append(str(exc))
             continue
 
+        manifests[manifest_path] = manifest
         extension_name = str(manifest['name']).strip()
         names.append(extension_name)
         if extension_name in seen_names:
@@ -53,16 +80,17 @@ def inspect_extensions(repo_root: Path, extensions_dir: Path) -> ExtensionInspec
                 if not isinstance(entry_name, str) or not isinstance(rel_path, str):
                     continue
                 try:
-                    resolved = resolve_safe_child(
+                    _, is_file = _resolve_declared_file(
                         repo_root,
                         rel_path,
                         context=f'extension `{extension_name}` entrypoint `{entry_name}`',
+                        resolved_files=resolved_files,
                     )
                 except ValueError as exc:
                     issues.append(str(exc))
                     continue
 
-                if not resolved.exists() or not resolved.is_file():
+                if not is_file:
                     issues.append(
                         f'{manifest_path}: entrypoint path missing `{rel_path}`',
                     )
@@ -81,16 +109,17 @@ def inspect_extensions(repo_root: Path, extensions_dir: Path) -> ExtensionInspec
                     continue
 
                 try:
-                    resolved_command = resolve_safe_child(
+                    resolved_command, is_file = _resolve_declared_file(
                         repo_root,
                         rel_path,
                         context=f'extension `{extension_name}` command `{normalized_command}`',
+                        resolved_files=resolved_files,
                     )
                 except ValueError as exc:
                     issues.append(str(exc))
                     continue
 
-                if not resolved_command.exists() or not resolved_command.is_file():
+                if not is_file:
                     issues.append(
                         f'{manifest_path}: command path missing `{rel_path}`',
                     )
@@ -98,4 +127,9 @@ def inspect_extensions(repo_root: Path, extensions_dir: Path) -> ExtensionInspec
 
                 command_registry[normalized_command] = resolved_command
 
-    return ExtensionInspection(names=names, command_registry=command_registry, issues=issues)
+    return ExtensionInspection(
+        names=names,
+        command_registry=command_registry,
+        issues=issues,
+        manifests=manifests,
+    )
@@ -4,7 +4,7 @@ from typing import Any
 
 from migration_sync_lib import ensure_safe_relative
 
-from .common import expect_bool, expect_dict, expect_int, expect_non_empty_str
+from .common import SHA256_HEX_RE, expect_bool, expect_dict, expect_int, expect_non_empty_str
 from .state_manifest import validate_state_migration_manifest
 
 
@@ -81,7 +81,7 @@ def validate_package_manifest(
             raise ValueError(f'{entry_context}.path invalid: {exc}') from exc
 
         digest = expect_non_empty_str(entry_dict.get('sha256'), context=f'{entry_context}.sha256')
-        if len(digest) != 64 or any(ch not in '0123456789abcdef' for ch in digest.lower()):
+        if not SHA256_HEX_RE.fullmatch(digest):
             raise ValueError(f'{entry_context}.sha256 must be a 64-char hex string')
 
         expect_int(entry_dict.get('size_bytes'), context=f'{entry_context}.size_bytes', min_value=0)
@@ -14,17 +14,17 @@ from .common import (
 METRIC_KEYS = ('privacy_risk', 'simplicity', 'merge_conflict_risk', 'auditability')
 
 _FILTERED_HISTORY_FIELDS = {
-    'privacy_risk': {'base', 'block_penalty', 'ambiguous_penalty'},
-    'simplicity': {'base', 'commit_divisor', 'commit_cap', 'ambiguous_penalty'},
-    'merge_conflict_risk': {'base', 'commit_divisor', 'commit_cap', 'ambiguous_penalty'},
-    'auditability': {'base', 'block_penalty', 'ambiguous_penalty'},
+    'privacy_risk': frozenset({'base', 'block_penalty', 'ambiguous_penalty'}),
+    'simplicity': frozenset({'base', 'commit_divisor', 'commit_cap', 'ambiguous_penalty'}),
+    'merge_conflict_risk': frozenset({'base', 'commit_divisor', 'commit_cap', 'ambiguous_penalty'}),
+    'auditability': frozenset({'base', 'block_penalty', 'ambiguous_penalty'}),
 }
 
 _CLEAN_FOUNDATION_FIELDS = {
-    'privacy_risk': {'base'},
-    'simplicity': {'base', 'commit_bonus_divisor', 'commit_bonus_cap'},
-    'merge_conflict_risk': {'base'},
-    'auditability': {'base'},
+    'privacy_risk': frozenset({'base'}),
+    'simplicity': frozenset({'base', 'commit_bonus_divisor', 'commit_bonus_cap'}),
+    'merge_conflict_risk': frozenset({'base'}),
+    'auditability': frozenset({'base'}),
 }
 
 
@@ -127,7 +127,7 @@ def validate_migration_sync_policy(
                 context=f'{context}.history_metrics.{candidate_name}',
             )
 
-            extra_metrics = set(candidate_dict) - set(allowed_fields)
+            extra_metrics = candidate_dict.keys() - allowed_fields.keys()
             if extra_metrics:
                 extras = ', '.join(sorted(extra_metrics))
                 raise ValueError(
@@ -140,7 +140,7 @@ def validate_migration_sync_policy(
                     context=f'{context}.history_metrics.{candidate_name}.{metric_name}',
                 )
                 allowed = allowed_fields[metric_name]
-                extra_fields = set(metric_dict) - allowed
+                extra_fields = metric_dict.keys() - allowed
                 if extra_fields:
                     extras = ', '.join(sorted(extra_fields))
                     raise ValueError(
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -131,7 +132,14 @@ def main(argv: list[str] | None = None) -> int:
         _print_registry_warnings(warnings)
         return 2
 
-    result = subprocess.run([sys.executable, str(script_path), *forwarded], check=False)
+    tool_argv = [sys.executable, str(script_path), *forwarded]
+    if os.name == 'posix':
+        # Hand the process over to the tool instead of waiting on a child interpreter.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, tool_argv)
+
+    result = subprocess.run(tool_argv, check=False)
     return result.returncode
 
 
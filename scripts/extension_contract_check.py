@@ -63,9 +63,10 @@ def main() -> int:
     report = load_extensions(repo_root=repo_root, extensions_dir=extensions_dir)
 
     if report.diagnostics:
-        print('Extension contract diagnostics:', file=sys.stderr)
-        for diagnostic in report.diagnostics:
-            print(f'- {diagnostic.render()}', file=sys.stderr)
+        sys.stderr.write(
+            'Extension contract diagnostics:\n'
+            + ''.join(f'- {diagnostic.render()}\n' for diagnostic in report.diagnostics),
+        )
 
     if report.errors:
         if args.strict:
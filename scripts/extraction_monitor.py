@@ -19,6 +19,8 @@ import argparse
 import json
 import subprocess
 import sys
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -28,6 +30,7 @@ from graph_cli import check_health, parse_count, run_cypher
 # If the DB is write-saturated, we *prefer* fast timeouts + cached last-known counts.
 PING_TIMEOUT = 2  # seconds
 QUERY_TIMEOUT = 4  # seconds per graph count query
+MCP_PROBE_TIMEOUT = 0.8  # seconds per MCP /health probe
 
 GRAPHS = [
     ("s1_sessions_main", 3646),
@@ -86,6 +89,35 @@ def fmt_time(ts: str | None) -> str:
         return "?"
 
 
+def probe_mcp_health(port: int) -> tuple[int, bool]:
+    """Return (port, healthy) for an MCP server's /health endpoint."""
+    try:
+        with urllib.request.urlopen(
+            f"http://localhost:{port}/health", timeout=MCP_PROBE_TIMEOUT
+        ) as resp:
+            return port, resp.status == 200
+    except Exception:
+        return port, False
+
+
+def parse_group_counts(out: str) -> dict[str, int] | None:
+    """Parse `group_id, count` rows from cypher-shell plain output.
+
+    Returns None when the output is empty (treated as a parse error). Groups
+    with no episodes produce no row, so callers should default them to 0.
+    """
+    if not out.strip():
+        return None
+    counts: dict[str, int] = {}
+    # Skip header line from cypher-shell --format plain
+    for line in out.splitlines()[1:]:
+        group_id, sep, raw_count = line.rpartition(",")
+        raw_count = raw_count.strip()
+        if sep and raw_count.isdigit():
+            counts[group_id.strip().strip('"')] = int(raw_count)
+    return counts
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(description="Graphiti extraction progress monitor")
     ap.add_argument("--backend", choices=["neo4j", "falkordb"], default="neo4j",
@@ -107,40 +139,43 @@ def main() -> None:
         .replace("+00:00", "Z")
     )
 
-    # --- 1) DB health ---
-    db_alive = False
-    for _attempt in (1, 2):
-        if check_health(backend, timeout=PING_TIMEOUT):
-            db_alive = True
-            break
-
-    if db_alive:
-        lines.append(f"{db_label}: \u2705 alive")
-        cache["last_ping_ok_at"] = cache["last_run_at"]
-    else:
-        last_ok = fmt_time(cache.get("last_ping_ok_at"))
-        lines.append(
-            f"{db_label}: \u23f3 busy/unresponsive \u2014 last OK at {last_ok}"
+    # --- 1) Episode counts ---
+    # Any count query that returns doubles as the DB health signal.
+    db_responded = False
+    episode_lines: list[str] = []
+
+    # For Neo4j (single DB): one grouped query covers every group_id.
+    # For FalkorDB: each graph is queried by name below.
+    group_counts: dict[str, int] | None = None
+    group_counts_error: Exception | None = None
+    if backend == "neo4j":
+        group_ids = ", ".join(f"'{graph}'" for graph, _ in GRAPHS)
+        q = (
+            f"MATCH (e:Episodic) WHERE e.group_id IN [{group_ids}] "
+            "RETURN e.group_id, count(e);"
         )
-
-    # --- 2) Episode counts ---
-    lines.append("")
-    lines.append("Episodes:")
+        try:
+            out = run_cypher(backend, "neo4j", q, timeout=QUERY_TIMEOUT)
+            db_responded = True
+            group_counts = parse_group_counts(out)
+        except Exception as exc:
+            group_counts_error = exc
 
     for graph, target in GRAPHS:
         try:
-            # For Neo4j (single DB): scope by group_id.
-            # For FalkorDB: query runs against the named graph.
+            count: int | None
             if backend == "neo4j":
-                q = f"MATCH (e:Episodic) WHERE e.group_id = '{graph}' RETURN count(e);"
+                if group_counts_error is not None:
+                    raise group_counts_error
+                count = group_counts.get(graph, 0) if group_counts is not None else None
             else:
                 q = "MATCH (e:Episodic) RETURN count(e)"
-
-            out = run_cypher(backend, graph, q, timeout=QUERY_TIMEOUT)
-            count: int | None = parse_count(out) if out.strip() else None
+                out = run_cypher(backend, graph, q, timeout=QUERY_TIMEOUT)
+                db_responded = True
+                count = parse_count(out) if out.strip() else None
 
             if count is None:
-                lines.append(f"  {graph}: \u26a0\ufe0f parse error")
+                episode_lines.append(f"  {graph}: \u26a0\ufe0f parse error")
                 continue
 
             cache["graphs"][graph] = {
@@ -150,63 +185,73 @@ def main() -> None:
             }
 
             if count >= target:
-                lines.append(f"  {graph}: \u2705 {count}/{target}")
+                episode_lines.append(f"  {graph}: \u2705 {count}/{target}")
             else:
                 pct = int(count / target * 100)
-                lines.append(f"  {graph}: \U0001f504 {count}/{target} ({pct}%)")
+                episode_lines.append(f"  {graph}: \U0001f504 {count}/{target} ({pct}%)")
 
         except subprocess.TimeoutExpired:
             last = cache["graphs"].get(graph) or {}
             last_count = last.get("count")
             last_at = fmt_time(last.get("at"))
             if last_count is None:
-                lines.append(f"  {graph}: \u23f3 busy (no recent sample)")
+                episode_lines.append(f"  {graph}: \u23f3 busy (no recent sample)")
             elif int(last_count) >= int(target):
-                lines.append(f"  {graph}: \u2705 {last_count}/{target} (cached {last_at})")
+                episode_lines.append(f"  {graph}: \u2705 {last_count}/{target} (cached {last_at})")
             else:
                 pct = int(int(last_count) / target * 100)
-                lines.append(
+                episode_lines.append(
                     f"  {graph}: \u23f3 busy (cached {last_count}/{target} ({pct}%) @ {last_at})"
                 )
 
         except Exception:
-            lines.append(f"  {graph}: \u26a0\ufe0f error")
+            episode_lines.append(f"  {graph}: \u26a0\ufe0f error")
+
+    # --- 2) DB health (only pinged when no count query got through) ---
+    db_alive = db_responded
+    if not db_alive:
+        for _attempt in (1, 2):
+            if check_health(backend, timeout=PING_TIMEOUT):
+                db_alive = True
+                break
+
+    if db_alive:
+        lines.append(f"{db_label}: \u2705 alive")
+        cache["last_ping_ok_at"] = cache["last_run_at"]
+    else:
+        last_ok = fmt_time(cache.get("last_ping_ok_at"))
+        lines.append(
+            f"{db_label}: \u23f3 busy/unresponsive \u2014 last OK at {last_ok}"
+        )
+
+    lines.append("")
+    lines.append("Episodes:")
+    lines.extend(episode_lines)
 
     save_cache(cache)
 
     # --- 3) MCP health ---
     lines.append("")
+    with ThreadPoolExecutor(max_workers=len(MCP_PORTS)) as executor:
+        mcp_results = list(executor.map(probe_mcp_health, MCP_PORTS))
     mcp_status: list[str] = []
-    for port in MCP_PORTS:
-        try:
-            r = subprocess.run(
-                [
-                    "curl", "-s", "-o", "/dev/null", "-w", "%{http_code}",
-                    "--max-time", "0.8", f"http://localhost:{port}/health",
-                ],
-                capture_output=True, text=True, timeout=1,
-            )
-            code = r.stdout.strip()
-            icon = '\u2705' if code == '200' else '\U0001f534'
-            mcp_status.append(f"{port}:{icon}")
-        except Exception:
-            mcp_status.append(f"{port}:\U0001f534")
+    for port, ok in mcp_results:
+        icon = '\u2705' if ok else '\U0001f534'
+        mcp_status.append(f"{port}:{icon}")
 
     lines.append("MCP: " + " ".join(mcp_status))
 
     # --- 4) Enqueue driver processes ---
     try:
-        r1 = subprocess.run(
-            ["pgrep", "-f", r"mcp_ingest_sessions\.py"],
-            capture_output=True, text=True, timeout=1,
-        )
-        sessions_drivers = len(r1.stdout.strip().splitlines()) if r1.stdout.strip() else 0
-
-        r2 = subprocess.run(
-            ["pgrep", "-f", r"ingest_compound_notes\.py"],
+        # One process-table scan (portable to macOS, unlike /proc) for both drivers.
+        # -ww disables width truncation; procps otherwise cuts args to $COLUMNS.
+        r = subprocess.run(
+            ["ps", "-ww", "-eo", "args="],
             capture_output=True, text=True, timeout=1,
         )
-        compound_drivers = len(r2.stdout.strip().splitlines()) if r2.stdout.strip() else 0
+        cmdlines = r.stdout.splitlines()
+        sessions_drivers = sum("mcp_ingest_sessions.py" in c for c in cmdlines)
+        compound_drivers = sum("ingest_compound_notes.py" in c for c in cmdlines)
 
         if sessions_drivers or compound_drivers:
             lines.append(f"Drivers: sessions={sessions_drivers} compound={compound_drivers}")
@@ -18,6 +18,14 @@ NEO4J_DATABASE = os.environ.get("NEO4J_DATABASE", "neo4j")
 NEO4J_HOST = os.environ.get("NEO4J_HOST", "localhost")
 NEO4J_PORT = os.environ.get("NEO4J_PORT", "7687")
 CYPHER_SHELL = os.environ.get("CYPHER_SHELL", "cypher-shell")
+# The password is passed via the NEO4J_PASSWORD env var, never on argv.
+_NEO4J_BASE_ARGS = (
+    CYPHER_SHELL,
+    "-u", NEO4J_USER,
+    "-d", NEO4J_DATABASE,
+    "-a", f"bolt://{NEO4J_HOST}:{NEO4J_PORT}",
+    "--format", "plain",
+)
 
 # FalkorDB defaults
 REDIS_CLI = os.environ.get("REDIS_CLI", "/opt/homebrew/opt/redis/bin/redis-cli")
@@ -41,14 +49,7 @@ def run_cypher(backend: str, graph_name: str, query: str, *, timeout: int = 30)
 
     if backend == "neo4j":
         _require_neo4j_password()
-        cmd = [
-            CYPHER_SHELL,
-            "-u", NEO4J_USER,
-            "-d", NEO4J_DATABASE,
-            "-a", f"bolt://{NEO4J_HOST}:{NEO4J_PORT}",
-            "--format", "plain",
-            query,
-        ]
+        cmd = [*_NEO4J_BASE_ARGS, query]
         env = {**os.environ, "NEO4J_PASSWORD": os.environ["NEO4J_PASSWORD"]}
         return subprocess.check_output(cmd, text=True, timeout=timeout, env=env)
 
@@ -64,14 +65,7 @@ def check_health(backend: str, *, timeout: int = 2) -> bool:
     try:
         if backend == "neo4j":
             _require_neo4j_password()
-            cmd = [
-                CYPHER_SHELL,
-                "-u", NEO4J_USER,
-                "-d", NEO4J_DATABASE,
-                "-a", f"bolt://{NEO4J_HOST}:{NEO4J_PORT}",
-                "--format", "plain",
-                "RETURN 1;",
-            ]
+            cmd = [*_NEO4J_BASE_ARGS, "RETURN 1;"]
             env = {**os.environ, "NEO4J_PASSWORD": os.environ["NEO4J_PASSWORD"]}
             r = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
             return r.returncode == 0
@@ -6,12 +6,22 @@ from __future__ import annotations
 import fnmatch
 import hashlib
 import json
+import os
+import re
 import shutil
 import subprocess
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+IO_WORKERS = min(8, os.cpu_count() or 4)
+# Below this many items a thread pool costs more to start than it saves.
+IO_PARALLEL_MIN_ITEMS = 16
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
 
 
 def now_utc_iso() -> str:
@@ -46,7 +56,8 @@ def run_git(repo_root: Path, *args: str, check: bool = True) -> subprocess.Compl
 def load_json(path: Path) -> dict[str, Any]:
     """Load JSON file with strict object expectation."""
 
-    payload = json.loads(path.read_text(encoding='utf-8'))
+    # json.loads detects UTF-8 on bytes input, skipping a separate str decode.
+    payload = json.loads(path.read_bytes())
     if not isinstance(payload, dict):
         raise ValueError(f'Expected JSON object in {path}')
     return payload
@@ -59,20 +70,47 @@ def dump_json(path: Path, payload: dict[str, Any]) -> None:
     path.write_text(f'{json.dumps(payload, indent=2, sort_keys=True)}\n', encoding='utf-8')
 
 
+def list_child_dirs(root: Path) -> list[Path]:
+    """Return sorted subdirectories of root, using scandir's cached entry types."""
+
+    with os.scandir(root) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.is_dir())
+
+
+def map_io(func: Callable[[_T], _R], items: Sequence[_T]) -> list[_R]:
+    """Apply func to items in order, on a thread pool when there are enough of them.
+
+    The first exception raised by func propagates to the caller.
+    """
+
+    if len(items) <= IO_PARALLEL_MIN_ITEMS:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        return list(executor.map(func, items))
+
+
 def sha256_file(path: Path) -> str:
     """Compute SHA-256 digest for a file path."""
 
-    digest = hashlib.sha256()
-    with path.open('rb') as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+    with path.open('rb', buffering=0) as handle:
+        # file_digest (3.11+) hashes via readinto on one reused buffer, skipping per-chunk bytes.
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(handle, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(4 * 1024 * 1024), b''):
             digest.update(chunk)
-    return digest.hexdigest()
+        return digest.hexdigest()
 
 
 def ensure_within_root(path: Path, root: Path, *, context: str) -> Path:
     """Resolve path and ensure it remains within root."""
 
-    resolved_root = root.resolve()
+    return _ensure_within_resolved_root(path, root.resolve(), context=context)
+
+
+def _ensure_within_resolved_root(path: Path, resolved_root: Path, *, context: str) -> Path:
+    """Like ensure_within_root, for callers that already resolved root once."""
+
     resolved_path = path.resolve()
     try:
         resolved_path.relative_to(resolved_root)
@@ -109,8 +147,11 @@ def resolve_safe_child(root: Path, rel_path: str, *, context: str) -> Path:
     return ensure_within_root(root / safe_rel, root, context=context)
 
 
-def _matches_any(path: str, patterns: Iterable[str]) -> bool:
-    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Fold fnmatch globs into one regex so each path is matched once."""
+
+    translated = [f'(?:{fnmatch.translate(pattern)})' for pattern in patterns]
+    return re.compile('|'.join(translated)) if translated else None
 
 
 def collect_manifest_files(
@@ -121,50 +162,56 @@ def collect_manifest_files(
 ) -> list[Path]:
     """Collect files declared by migration manifest rules."""
 
+    root = repo_root.resolve()
     selected: dict[str, Path] = {}
 
     for rel in required_files:
-        candidate = resolve_safe_child(repo_root, rel, context='required manifest file')
-        if not candidate.exists() or not candidate.is_file():
+        candidate = _ensure_within_resolved_root(
+            root / ensure_safe_relative(rel),
+            root,
+            context='required manifest file',
+        )
+        if not candidate.is_file():
             raise FileNotFoundError(f'Required manifest file missing: {rel}')
-        selected[repo_relative(candidate, repo_root)] = candidate
+        selected[candidate.relative_to(root).as_posix()] = candidate
 
     for pattern in optional_globs:
-        for candidate in repo_root.glob(pattern):
+        for candidate in root.glob(pattern):
             if not candidate.is_file():
                 continue
-            safe_candidate = ensure_within_root(
+            safe_candidate = _ensure_within_resolved_root(
                 candidate,
-                repo_root,
+                root,
                 context=f'optional glob match for `{pattern}`',
             )
-            rel = repo_relative(safe_candidate, repo_root)
-            selected[rel] = safe_candidate
+            selected[safe_candidate.relative_to(root).as_posix()] = safe_candidate
 
-    filtered = [
-        candidate
-        for rel, candidate in selected.items()
-        if not _matches_any(rel, exclude_globs)
+    exclude_re = _compile_globs(exclude_globs)
+    return [
+        selected[rel]
+        for rel in sorted(selected)
+        if exclude_re is None or not exclude_re.match(rel)
     ]
 
-    return sorted(filtered, key=lambda path: repo_relative(path, repo_root))
-
 
 def collect_file_entries(files: list[Path], repo_root: Path) -> list[dict[str, Any]]:
     """Build normalized metadata entries for a list of files."""
 
-    entries: list[dict[str, Any]] = []
-    for path in files:
-        safe_path = ensure_within_root(path, repo_root, context='manifest-selected file')
-        rel = repo_relative(safe_path, repo_root)
-        entries.append(
-            {
-                'path': rel,
-                'sha256': sha256_file(safe_path),
-                'size_bytes': safe_path.stat().st_size,
-            },
-        )
-    return entries
+    root = repo_root.resolve()
+    safe_paths = [
+        _ensure_within_resolved_root(path, root, context='manifest-selected file')
+        for path in files
+    ]
+
+    def _entry(safe_path: Path) -> dict[str, Any]:
+        return {
+            'path': safe_path.relative_to(root).as_posix(),
+            'sha256': sha256_file(safe_path),
+            'size_bytes': safe_path.stat().st_size,
+        }
+
+    # Hashing releases the GIL, so threads overlap reads and digests across files.
+    return map_io(_entry, safe_paths)
 
 
 def file_has_expected_content(
@@ -187,9 +234,13 @@ def evaluate_payload_entries(
     payload_root: Path,
     *,
     context: str,
+    check_payload: bool = True,
 ) -> tuple[list[tuple[str, Path, str, int]], list[str], list[str]]:
     """Evaluate payload entries for presence and integrity.
 
+    With ``check_payload=False`` only paths are validated and resolved; no
+    payload file is stat'ed or hashed and both issue lists come back empty.
+
     Returns:
       - planned entries as ``(relative_path, payload_source_path, expected_sha256, expected_size_bytes)``
       - missing payload relative paths
@@ -208,19 +259,29 @@ def evaluate_payload_entries(
         src = resolve_safe_child(payload_root, rel, context=context)
         planned_entries.append((rel, src, expected_hash, expected_size))
 
-        if not src.exists() or not src.is_file():
-            missing_payload.append(rel)
-            continue
+    if not check_payload:
+        return planned_entries, missing_payload, integrity_errors
+
+    def _check(planned: tuple[str, Path, str, int]) -> list[str] | None:
+        rel, src, expected_hash, expected_size = planned
+        if not src.is_file():
+            return None
 
+        issues: list[str] = []
         actual_size = src.stat().st_size
         if actual_size != expected_size:
-            integrity_errors.append(
-                f'{rel}: size mismatch (expected {expected_size}, got {actual_size})',
-            )
+            issues.append(f'{rel}: size mismatch (expected {expected_size}, got {actual_size})')
+        if sha256_file(src) != expected_hash:
+            issues.append(f'{rel}: checksum mismatch')
+        return issues
+
+    results = map_io(_check, planned_entries)
 
-        actual_hash = sha256_file(src)
-        if actual_hash != expected_hash:
-            integrity_errors.append(f'{rel}: checksum mismatch')
+    for (rel, _, _, _), issues in zip(planned_entries, results, strict=True):
+        if issues is None:
+            missing_payload.append(rel)
+        else:
+            integrity_errors.extend(issues)
 
     return planned_entries, missing_payload, integrity_errors
 
@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import fnmatch
+import re
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from migration_sync_lib import resolve_repo_root as _resolve_repo_root
@@ -105,6 +107,30 @@ def collect_git_files(repo_root: Path, include_untracked: bool) -> list[str]:
     return sorted(files)
 
 
+@lru_cache(maxsize=16)
+def _compile_rules(rules: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Union glob rules into one regex; group ``_r<N>`` names the matched rule.
+
+    Alternation tries branches left to right, so the reported rule is the
+    first one in list order that matches, as with a sequential fnmatch loop.
+    """
+    if not rules:
+        return None
+    return re.compile(
+        '|'.join(f'(?P<_r{index}>{fnmatch.translate(rule)})' for index, rule in enumerate(rules)),
+    )
+
+
+def _first_match(path: str, rules: list[str]) -> str | None:
+    pattern = _compile_rules(tuple(rules))
+    if pattern is None:
+        return None
+    match = pattern.match(path)
+    if match is None or match.lastgroup is None:
+        return None
+    return rules[int(match.lastgroup[2:])]
+
+
 def classify_path(path: str, allowlist: list[str], denylist: list[str]) -> RuleDecision:
     """Classify a repo path as ALLOW/BLOCK/AMBIGUOUS.
 
@@ -113,13 +139,13 @@ def classify_path(path: str, allowlist: list[str], denylist: list[str]) -> RuleD
     If neither list matches, the path is AMBIGUOUS.
     """
     # Check allowlist first — explicit allow overrides general deny.
-    for allow_rule in allowlist:
-        if fnmatch.fnmatch(path, allow_rule):
-            return RuleDecision(path, ALLOW, 'ALLOWLIST_MATCH', allow_rule)
+    allow_rule = _first_match(path, allowlist)
+    if allow_rule is not None:
+        return RuleDecision(path, ALLOW, 'ALLOWLIST_MATCH', allow_rule)
 
-    for deny_rule in denylist:
-        if fnmatch.fnmatch(path, deny_rule):
-            return RuleDecision(path, BLOCK, 'DENYLIST_MATCH', deny_rule)
+    deny_rule = _first_match(path, denylist)
+    if deny_rule is not None:
+        return RuleDecision(path, BLOCK, 'DENYLIST_MATCH', deny_rule)
 
     return RuleDecision(path, AMBIGUOUS, 'NO_MATCH', None)
 
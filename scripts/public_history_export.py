@@ -116,16 +116,16 @@ def _resolve_output_path(path: Path) -> Path:
     return (Path.cwd() / path).resolve()
 
 
-def _git_count(repo_root: Path, *args: str) -> int:
-    result = run_git(repo_root, *args, check=False)
-    if result.returncode != 0:
-        return 0
+def _git_history_counts(repo_root: Path) -> tuple[int, int]:
+    """Return (commit_count, author_count) for HEAD from a single git log."""
 
-    value = result.stdout.strip()
-    if value.isdigit():
-        return int(value)
+    # %aN applies .mailmap, matching how `git shortlog` groups authors.
+    result = run_git(repo_root, 'log', '--format=%aN', 'HEAD', check=False)
+    if result.returncode != 0:
+        return 0, 0
 
-    return len([line for line in value.splitlines() if line.strip()])
+    authors = result.stdout.splitlines()
+    return len(authors), len(set(authors))
 
 
 def _number(value: object, default: float) -> float:
@@ -317,8 +317,7 @@ def main() -> int:
     decisions = [classify_path(path, allowlist=allowlist, denylist=denylist) for path in files]
     counts, blocked, ambiguous = summarize_decisions(decisions)
 
-    commit_count = _git_count(repo_root, 'rev-list', '--count', 'HEAD')
-    author_count = _git_count(repo_root, 'shortlog', '-sn', 'HEAD')
+    commit_count, author_count = _git_history_counts(repo_root)
     head_sha_result = run_git(repo_root, 'rev-parse', 'HEAD', check=False)
     head_sha = head_sha_result.stdout.strip() if head_sha_result.returncode == 0 else ''
 
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
+from collections import Counter
 from pathlib import Path
 
 from delta_contracts import validate_state_migration_manifest
@@ -16,6 +18,7 @@ from migration_sync_lib import (
     copy_entry,
     dump_json,
     load_json,
+    map_io,
     now_utc_iso,
     repo_relative,
     resolve_repo_root,
@@ -54,16 +57,21 @@ def main() -> int:
     files = collect_manifest_files(repo_root, required_files, optional_globs, exclude_globs)
     entries = collect_file_entries(files, repo_root)
 
-    head = run_git(repo_root, 'rev-parse', 'HEAD')
+    head = run_git(repo_root, 'rev-parse', 'HEAD', check=False)
     source_commit = head.stdout.strip() if head.returncode == 0 else ''
 
     package_root = args.out if args.out.is_absolute() else (Path.cwd() / args.out).resolve()
     payload_root = package_root / 'payload'
 
-    if package_root.exists() and any(package_root.iterdir()):
-        if not args.force:
-            raise ValueError(f'Output directory already exists and is not empty: {package_root}')
-        shutil.rmtree(package_root)
+    if package_root.exists():
+        if args.force:
+            shutil.rmtree(package_root)
+        else:
+            with os.scandir(package_root) as existing:
+                if next(existing, None) is not None:
+                    raise ValueError(
+                        f'Output directory already exists and is not empty: {package_root}',
+                    )
 
     package_root.mkdir(parents=True, exist_ok=True)
 
@@ -89,9 +97,7 @@ def main() -> int:
     dump_json(package_root / 'package_manifest.json', package_manifest)
 
     if not args.dry_run:
-        for entry in entries:
-            rel = str(entry['path'])
-            copy_entry(repo_root, payload_root, rel)
+        map_io(lambda entry: copy_entry(repo_root, payload_root, str(entry['path'])), entries)
 
     print(f'Package manifest written: {package_root / "package_manifest.json"}')
     if args.dry_run:
@@ -99,10 +105,7 @@ def main() -> int:
     else:
         print(f'Payload files copied: {len(entries)}')
 
-    by_top_level: dict[str, int] = {}
-    for path in (str(entry['path']) for entry in entries):
-        top = path.split('/', 1)[0]
-        by_top_level[top] = by_top_level.get(top, 0) + 1
+    by_top_level = Counter(str(entry['path']).split('/', 1)[0] for entry in entries)
     summary = ', '.join(f'{key}={value}' for key, value in sorted(by_top_level.items()))
     print(f'Included files ({len(entries)}): {summary}')
     print(f'Repo root: {repo_root}')
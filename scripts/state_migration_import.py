@@ -116,6 +116,8 @@ def main() -> int:
         entries=entries,
         payload_root=payload_root,
         context='migration payload entry',
+        # Dry-run preview packages carry no payload by design.
+        check_payload=not dry_run_preview,
     )
 
     planned_writes: list[tuple[str, Path, Path]] = []
@@ -77,8 +77,6 @@ def _valid_contract_policy() -> dict:
 class DeltaContractCheckTests(unittest.TestCase):
     def _init_repo(self, root: Path) -> None:
         subprocess.run(['git', 'init'], cwd=root, check=True, capture_output=True, text=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=root, check=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=root, check=True)
 
     def _seed(self, root: Path) -> None:
         (root / 'config').mkdir(parents=True, exist_ok=True)
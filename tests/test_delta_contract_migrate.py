@@ -78,8 +78,6 @@ def _state_manifest() -> dict:
 class DeltaContractMigrateTests(unittest.TestCase):
     def _init_repo(self, root: Path) -> None:
         subprocess.run(['git', 'init'], cwd=root, check=True, capture_output=True, text=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=root, check=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=root, check=True)
 
     def _seed(self, root: Path) -> None:
         (root / 'config').mkdir(parents=True, exist_ok=True)
@@ -177,6 +175,43 @@ class DeltaContractMigrateTests(unittest.TestCase):
             )
             self.assertEqual(extension_check.returncode, 0, msg=extension_check.stderr)
 
+    def test_suffixes_colliding_command_slugs_deterministically(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            self._init_repo(repo)
+            self._seed(repo)
+
+            (repo / 'extensions' / 'sample' / 'manifest.json').write_text(
+                f'{json.dumps({"name": "sample-extension", "version": "0.1.0", "capabilities": ["sync"], "entrypoints": {"doctor": "scripts/tool.py"}, "commands": {"Doctor Run": "scripts/tool.py", "doctor_run": "scripts/tool.py", "doctor-run": "scripts/tool.py", "doctor-run-2": "scripts/tool.py"}}, indent=2)}\n',
+                encoding='utf-8',
+            )
+
+            write_run = subprocess.run(
+                [
+                    sys.executable,
+                    str(MIGRATE_SCRIPT),
+                    '--repo',
+                    str(repo),
+                    '--write',
+                ],
+                cwd=repo,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            self.assertEqual(write_run.returncode, 0, msg=write_run.stderr)
+
+            manifest = json.loads((repo / 'extensions' / 'sample' / 'manifest.json').read_text(encoding='utf-8'))
+            self.assertEqual(
+                list(manifest['commands']),
+                [
+                    'sample-extension/doctor-run',
+                    'sample-extension/doctor-run-2',
+                    'sample-extension/doctor-run-3',
+                    'sample-extension/doctor-run-2-2',
+                ],
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / 'scripts'
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from extraction_monitor import parse_group_counts  # noqa: E402
+
+
+class ParseGroupCountsTests(unittest.TestCase):
+    def test_parses_header_and_rows(self) -> None:
+        out = 'e.group_id, count(e)\n"s1_sessions_main", 3646\n"s1_writing_samples", 83\n'
+        self.assertEqual(
+            parse_group_counts(out),
+            {'s1_sessions_main': 3646, 's1_writing_samples': 83},
+        )
+
+    def test_header_only_yields_no_counts(self) -> None:
+        counts = parse_group_counts('e.group_id, count(e)\n')
+        self.assertEqual(counts, {})
+        # Callers default missing groups to 0.
+        self.assertEqual(counts.get('s1_sessions_main', 0), 0)
+
+    def test_empty_output_is_parse_error(self) -> None:
+        self.assertIsNone(parse_group_counts(''))
+        self.assertIsNone(parse_group_counts('\n  \n'))
+
+    def test_group_id_containing_comma(self) -> None:
+        out = 'e.group_id, count(e)\n"team,alpha", 12\n'
+        self.assertEqual(parse_group_counts(out), {'team,alpha': 12})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,6 +44,34 @@ class PublicBoundaryPolicyUnitTests(unittest.TestCase):
         self.assertEqual(decision.status, ALLOW)
         self.assertEqual(decision.reason_code, 'ALLOWLIST_MATCH')
 
+    def test_classify_path_reports_first_matching_rule_in_list_order(self) -> None:
+        allow_rules = ['docs/private/*', 'docs/*a*b*', 'docs/**', 'docs/public/*.md']
+        for allowlist, expected in (
+            (allow_rules, 'docs/*a*b*'),
+            (list(reversed(allow_rules)), 'docs/public/*.md'),
+        ):
+            decision = classify_path(
+                path='docs/public/alpha_beta.md',
+                allowlist=allowlist,
+                denylist=['docs/**'],
+            )
+            self.assertEqual(decision.status, ALLOW)
+            self.assertEqual(decision.matched_rule, expected)
+
+        deny_rules = ['*.txt', 'secrets/*a*b*', '*.key', 'secrets/**']
+        for denylist, expected in (
+            (deny_rules, 'secrets/*a*b*'),
+            (list(reversed(deny_rules)), 'secrets/**'),
+        ):
+            decision = classify_path(
+                path='secrets/alpha/beta.key',
+                allowlist=['docs/**'],
+                denylist=denylist,
+            )
+            self.assertEqual(decision.status, BLOCK)
+            self.assertEqual(decision.reason_code, 'DENYLIST_MATCH')
+            self.assertEqual(decision.matched_rule, expected)
+
     def test_summarize_decisions_splits_status_buckets(self) -> None:
         decisions = [
             RuleDecision(path='a', status=ALLOW, reason_code='ALLOWLIST_MATCH', matched_rule='a'),
@@ -12,10 +12,16 @@ SCRIPT = Path(__file__).resolve().parents[1] / 'scripts' / 'public_history_expor
 
 class PublicHistoryExportTests(unittest.TestCase):
     def _init_repo(self, repo: Path) -> None:
-        subprocess.run(['git', 'init'], cwd=repo, check=True, capture_output=True, text=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=repo, check=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=repo, check=True)
-        subprocess.run(['git', 'branch', '-M', 'main'], cwd=repo, check=True)
+        subprocess.run(
+            ['git', 'init', '-b', 'main'],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        # Append the commit identity directly instead of spawning two `git config` calls.
+        with (repo / '.git' / 'config').open('a', encoding='utf-8') as config:
+            config.write('[user]\n\temail = test@example.com\n\tname = Test User\n')
 
     def test_generates_reports_for_both_modes(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -13,18 +14,46 @@ EXPORT_SCRIPT = SCRIPTS_DIR / 'state_migration_export.py'
 CHECK_SCRIPT = SCRIPTS_DIR / 'state_migration_check.py'
 IMPORT_SCRIPT = SCRIPTS_DIR / 'state_migration_import.py'
 
+STATE_MANIFEST = {
+    'version': 1,
+    'package_name': 'test-state',
+    'required_files': [
+        'config/public_export_allowlist.yaml',
+        'config/public_export_denylist.yaml',
+        'config/migration_sync_policy.json',
+        'config/state_migration_manifest.json',
+    ],
+    'optional_globs': ['docs/public/*.md', 'scripts/*.py', 'state/*.db'],
+    'exclude_globs': ['**/__pycache__/**', '**/*.pyc'],
+}
+STATE_MANIFEST_JSON = f'{json.dumps(STATE_MANIFEST, indent=2)}\n'
+
 
 class StateMigrationKitTests(unittest.TestCase):
-    def _init_repo(self, repo: Path) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Seed one git repo per class; tests copy it instead of re-running git.
+        cls._template_tmp = tempfile.TemporaryDirectory()
+        cls._template_repo = Path(cls._template_tmp.name) / 'repo'
+        cls._template_repo.mkdir()
+        cls._init_repo(cls._template_repo)
+        cls._seed_files(cls._template_repo)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._template_tmp.cleanup()
+
+    def _copy_seeded_repo(self, repo: Path) -> None:
+        shutil.copytree(self._template_repo, repo)
+
+    @staticmethod
+    def _init_repo(repo: Path) -> None:
         subprocess.run(['git', 'init'], cwd=repo, check=True, capture_output=True, text=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=repo, check=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=repo, check=True)
 
-    def _seed_files(self, repo: Path) -> None:
-        (repo / 'config').mkdir(parents=True, exist_ok=True)
-        (repo / 'docs' / 'public').mkdir(parents=True, exist_ok=True)
-        (repo / 'scripts').mkdir(parents=True, exist_ok=True)
-        (repo / 'state').mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _seed_files(repo: Path) -> None:
+        for rel in ('config', 'docs/public', 'scripts', 'state'):
+            (repo / rel).mkdir(parents=True, exist_ok=True)
 
         (repo / 'config' / 'public_export_allowlist.yaml').write_text('version: 1\nallowlist:\n', encoding='utf-8')
         (repo / 'config' / 'public_export_denylist.yaml').write_text('version: 1\ndenylist:\n', encoding='utf-8')
@@ -35,35 +64,15 @@ class StateMigrationKitTests(unittest.TestCase):
         (repo / 'state' / 'ingest_registry.db').write_text('ingest-registry', encoding='utf-8')
         (repo / 'state' / 'candidates.db').write_text('candidates', encoding='utf-8')
 
-        manifest = {
-            'version': 1,
-            'package_name': 'test-state',
-            'required_files': [
-                'config/public_export_allowlist.yaml',
-                'config/public_export_denylist.yaml',
-                'config/migration_sync_policy.json',
-                'config/state_migration_manifest.json',
-            ],
-            'optional_globs': ['docs/public/*.md', 'scripts/*.py', 'state/*.db'],
-            'exclude_globs': ['**/__pycache__/**', '**/*.pyc'],
-        }
-        (repo / 'config' / 'state_migration_manifest.json').write_text(
-            f'{json.dumps(manifest, indent=2)}\n',
-            encoding='utf-8',
-        )
-
-        subprocess.run(['git', 'add', '.'], cwd=repo, check=True)
-        subprocess.run(['git', 'commit', '-m', 'seed'], cwd=repo, check=True)
+        (repo / 'config' / 'state_migration_manifest.json').write_text(STATE_MANIFEST_JSON, encoding='utf-8')
 
     def _sha256_text(self, content: str) -> str:
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
-    def test_export_check_import_dry_run_and_full(self) -> None:
+    def test_export_check_import_dry_run(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo = Path(tmp) / 'repo'
-            repo.mkdir(parents=True, exist_ok=True)
-            self._init_repo(repo)
-            self._seed_files(repo)
+            self._copy_seeded_repo(repo)
 
             package = repo / 'out' / 'package'
 
@@ -87,7 +96,7 @@ class StateMigrationKitTests(unittest.TestCase):
             )
             self.assertEqual(export_preview.returncode, 0, msg=export_preview.stderr)
 
-            manifest_preview = json.loads((package / 'package_manifest.json').read_text(encoding='utf-8'))
+            manifest_preview = json.loads((package / 'package_manifest.json').read_bytes())
             self.assertTrue(manifest_preview['dry_run_preview'])
             self.assertGreater(manifest_preview['entry_count'], 0)
 
@@ -109,6 +118,15 @@ class StateMigrationKitTests(unittest.TestCase):
             )
             self.assertEqual(import_preview.returncode, 0, msg=import_preview.stderr)
 
+    def test_export_check_full(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / 'repo'
+            self._copy_seeded_repo(repo)
+
+            package = repo / 'out' / 'package'
+            package.mkdir(parents=True, exist_ok=True)
+            (package / 'package_manifest.json').write_text('{"dry_run_preview": true}\n', encoding='utf-8')
+
             export_full = subprocess.run(
                 [
                     sys.executable,
@@ -128,6 +146,11 @@ class StateMigrationKitTests(unittest.TestCase):
             )
             self.assertEqual(export_full.returncode, 0, msg=export_full.stderr)
 
+            manifest_full = json.loads((package / 'package_manifest.json').read_bytes())
+            self.assertFalse(manifest_full['dry_run_preview'])
+            self.assertEqual(manifest_full['source_commit'], '')
+            self.assertTrue((package / 'payload').is_dir())
+
             check_full = subprocess.run(
                 [sys.executable, str(CHECK_SCRIPT), '--package', str(package)],
                 cwd=repo,
@@ -137,12 +160,119 @@ class StateMigrationKitTests(unittest.TestCase):
             )
             self.assertEqual(check_full.returncode, 0, msg=check_full.stderr)
 
+    def test_export_records_source_commit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / 'repo'
+            self._copy_seeded_repo(repo)
+            subprocess.run(['git', 'add', '.'], cwd=repo, check=True)
+            subprocess.run(
+                [
+                    'git',
+                    '-c',
+                    'user.email=test@example.com',
+                    '-c',
+                    'user.name=Test User',
+                    'commit',
+                    '-m',
+                    'seed',
+                ],
+                cwd=repo,
+                check=True,
+                capture_output=True,
+            )
+            head = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=repo,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+
+            package = repo / 'out' / 'package'
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(EXPORT_SCRIPT),
+                    '--repo',
+                    str(repo),
+                    '--manifest',
+                    'config/state_migration_manifest.json',
+                    '--out',
+                    str(package),
+                ],
+                cwd=repo,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+            manifest = json.loads((package / 'package_manifest.json').read_bytes())
+            self.assertEqual(manifest['source_commit'], head)
+
+    def test_export_refuses_non_empty_output_without_force(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / 'repo'
+            self._copy_seeded_repo(repo)
+
+            package = repo / 'out' / 'package'
+            package.mkdir(parents=True, exist_ok=True)
+            (package / 'stale.txt').write_text('stale\n', encoding='utf-8')
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(EXPORT_SCRIPT),
+                    '--repo',
+                    str(repo),
+                    '--manifest',
+                    'config/state_migration_manifest.json',
+                    '--out',
+                    str(package),
+                ],
+                cwd=repo,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            self.assertEqual(result.returncode, 2, msg=result.stderr)
+            self.assertIn('already exists and is not empty', result.stderr)
+            self.assertTrue((package / 'stale.txt').exists())
+
+    def test_export_force_replaces_non_empty_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / 'repo'
+            self._copy_seeded_repo(repo)
+
+            package = repo / 'out' / 'package'
+            package.mkdir(parents=True, exist_ok=True)
+            (package / 'stale.txt').write_text('stale\n', encoding='utf-8')
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(EXPORT_SCRIPT),
+                    '--repo',
+                    str(repo),
+                    '--manifest',
+                    'config/state_migration_manifest.json',
+                    '--out',
+                    str(package),
+                    '--force',
+                ],
+                cwd=repo,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            self.assertFalse((package / 'stale.txt').exists())
+            self.assertTrue((package / 'payload').is_dir())
+
     def test_import_blocks_tampered_payload(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo = Path(tmp) / 'repo'
-            repo.mkdir(parents=True, exist_ok=True)
-            self._init_repo(repo)
-            self._seed_files(repo)
+            self._copy_seeded_repo(repo)
 
             package = repo / 'out' / 'package'
             export_full = subprocess.run(
@@ -164,7 +294,7 @@ class StateMigrationKitTests(unittest.TestCase):
             )
             self.assertEqual(export_full.returncode, 0, msg=export_full.stderr)
 
-            manifest = json.loads((package / 'package_manifest.json').read_text(encoding='utf-8'))
+            manifest = json.loads((package / 'package_manifest.json').read_bytes())
             first_entry = manifest['entries'][0]['path']
             payload_file = package / 'payload' / first_entry
             payload_file.write_text('tampered\n', encoding='utf-8')
@@ -191,9 +321,7 @@ class StateMigrationKitTests(unittest.TestCase):
     def test_import_is_idempotent_when_target_matches_payload(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo = Path(tmp) / 'repo'
-            repo.mkdir(parents=True, exist_ok=True)
-            self._init_repo(repo)
-            self._seed_files(repo)
+            self._copy_seeded_repo(repo)
 
             package = repo / 'out' / 'package'
             export = subprocess.run(
@@ -253,9 +381,7 @@ class StateMigrationKitTests(unittest.TestCase):
     def test_check_fails_on_target_manifest_version_mismatch(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             source = Path(tmp) / 'source'
-            source.mkdir(parents=True, exist_ok=True)
-            self._init_repo(source)
-            self._seed_files(source)
+            self._copy_seeded_repo(source)
 
             package = source / 'out' / 'package'
             export = subprocess.run(
@@ -280,18 +406,7 @@ class StateMigrationKitTests(unittest.TestCase):
             target = Path(tmp) / 'target'
             target.mkdir(parents=True, exist_ok=True)
             self._init_repo(target)
-            target_manifest = {
-                'version': 2,
-                'package_name': 'test-state',
-                'required_files': [
-                    'config/public_export_allowlist.yaml',
-                    'config/public_export_denylist.yaml',
-                    'config/migration_sync_policy.json',
-                    'config/state_migration_manifest.json',
-                ],
-                'optional_globs': ['docs/public/*.md', 'scripts/*.py', 'state/*.db'],
-                'exclude_globs': ['**/__pycache__/**', '**/*.pyc'],
-            }
+            target_manifest = {**STATE_MANIFEST, 'version': 2}
             (target / 'config').mkdir(parents=True, exist_ok=True)
             (target / 'config' / 'state_migration_manifest.json').write_text(
                 f'{json.dumps(target_manifest, indent=2)}\n',
@@ -319,9 +434,7 @@ class StateMigrationKitTests(unittest.TestCase):
     def test_check_fails_on_target_manifest_scope_mismatch(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             source = Path(tmp) / 'source'
-            source.mkdir(parents=True, exist_ok=True)
-            self._init_repo(source)
-            self._seed_files(source)
+            self._copy_seeded_repo(source)
 
             package = source / 'out' / 'package'
             export = subprocess.run(
@@ -347,14 +460,7 @@ class StateMigrationKitTests(unittest.TestCase):
             target.mkdir(parents=True, exist_ok=True)
             self._init_repo(target)
             target_manifest = {
-                'version': 1,
-                'package_name': 'test-state',
-                'required_files': [
-                    'config/public_export_allowlist.yaml',
-                    'config/public_export_denylist.yaml',
-                    'config/migration_sync_policy.json',
-                    'config/state_migration_manifest.json',
-                ],
+                **STATE_MANIFEST,
                 'optional_globs': ['docs/public/*.md', 'scripts/*.py'],
                 'exclude_globs': ['**/*.pyc'],
             }
@@ -386,9 +492,7 @@ class StateMigrationKitTests(unittest.TestCase):
     def test_import_dry_run_fails_when_overwrite_conflicts_exist(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo = Path(tmp) / 'repo'
-            repo.mkdir(parents=True, exist_ok=True)
-            self._init_repo(repo)
-            self._seed_files(repo)
+            self._copy_seeded_repo(repo)
 
             package = repo / 'out' / 'package'
             export = subprocess.run(